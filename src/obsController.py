@@ -1,65 +1,504 @@
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from uuid import uuid4
+
 import obsws_python as obs
+from obsws_python.error import OBSSDKError, OBSSDKRequestError
+from websocket import WebSocketConnectionClosedException
+
+# InputKindCapability flag for "supports audio" (bit 1) in the obs-websocket protocol.
+_AUDIO_CAP = 1 << 1  # == 2
+
+# Errors that mean the websocket to OBS has dropped and is worth reopening.
+_CONNECTION_LOST = (WebSocketConnectionClosedException, ConnectionError)
+
+# Requests that must not be re-sent after a dropped connection: if the
+# first attempt reached OBS, a retry would apply them twice.
+_NO_RETRY = frozenset({"toggle_input_mute"})
 
 
 class ObsController:
     """
     High-level convenience wrapper around obsws_python.ReqClient.
 
+    An obsws_python.EventClient runs alongside it so state that OBS
+    announces through events (e.g. the current scene) can be read locally.
+
     This class assumes:
       - OBS is running
       - obs-websocket is enabled and reachable (config.toml or manual settings)
       - All visual sources you care about live inside groups (folders),
         e.g. 'Audio', 'Video', 'Chaos'.
+
+    Every attribute is declared below so the module can be compiled with
+    mypyc (`mypyc obsController.py`); the compiled extension is imported
+    in place of this file with no API changes.
     """
 
-    def __init__(self) -> None:
+    client: obs.ReqClient
+    events: obs.EventClient
+    _ttl: float
+    _inputs_cache: tuple[float, list[dict], dict[str, dict], frozenset[str]] | None
+    _current_scene: str | None
+    _source_index: dict[str, tuple[str, int]] | None
+    _source_generation: int
+    _source_lock: threading.Lock
+    _mute_state: dict[str, bool]
+    _audio_names: frozenset[str] | None
+    _inputs_generation: int
+    _inputs_lock: threading.Lock
+    _lock: threading.RLock
+    _closed: bool
+
+    def __init__(self, ttl: float = 0.25) -> None:
         """
         Initialize the OBS websocket client.
 
+        Args:
+            ttl: how long (in seconds) the input list from get_inputs()
+                 is reused before it is fetched from OBS again.
+
         Raises:
             SystemExit: if a connection to OBS cannot be established.
         """
+        self._ttl = ttl
+        self._inputs_cache = None
+        self._current_scene = None
+        self._source_index = None
+        # Bumped whenever the source index is invalidated (including scene
+        # changes), so a rebuild or current-scene fetch that overlapped an
+        # invalidating event is not stored.
+        self._source_generation = 0
+        self._source_lock = threading.Lock()
+        self._mute_state = {}
+        self._audio_names = None
+        # Same idea as _source_generation, for the input list and audio set.
+        self._inputs_generation = 0
+        self._inputs_lock = threading.Lock()
+        # Serializes request/response pairs on the shared socket. call_async()
+        # holds it for a whole method, so it is re-entrant.
+        self._lock = threading.RLock()
+        self._closed = False
+
+        # No permessage-deflate: websocket-client (under obsws_python) can't
+        # decode compressed frames, so offering the extension would break
+        # every reply. Batching and the caches keep the payloads small instead.
         try:
             self.client = obs.ReqClient()
+            self.events = self._connect_events()
+            self._audio_inputs()
         except Exception as e:
             print("ERROR: Unable to log into OBS, check config.toml has proper details.")
             print("Reason:", e)
             raise SystemExit()
-        
+
+    def __enter__(self) -> "ObsController":
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the websocket connections to OBS.
+
+        The controller can't be used afterwards; any further request
+        raises OBSSDKError instead of reconnecting.
+        """
+        self._closed = True
+        self.client.disconnect()
+        self.events.disconnect()
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise OBSSDKError("ObsController has been closed")
+
+    def _connect_events(self) -> obs.EventClient:
+        """
+        Open the event connection and register the callbacks that keep
+        the local caches in sync with OBS.
+        """
+        events = obs.EventClient()
+        events.callback.register([
+            self.on_current_program_scene_changed,
+            self.on_scene_name_changed,
+            self.on_scene_item_created,
+            self.on_scene_item_removed,
+            self.on_scene_item_list_reindexed,
+            self.on_input_name_changed,
+            self.on_input_mute_state_changed,
+            self.on_input_created,
+            self.on_input_removed,
+        ])
+        return events
+
+    def _reconnect(self) -> None:
+        """
+        Replace dropped request/event clients with freshly connected ones.
+
+        Anything cached from events may have been missed while the
+        connection was down, so those caches are cleared as well.
+        """
+        for client in (self.client, self.events):
+            try:
+                client.disconnect()
+            except Exception:
+                pass
+        self._current_scene = None
+        self._invalidate_sources()
+        self._mute_state = {}
+        self._invalidate_inputs()
+        self.client = obs.ReqClient()
+        self.events = self._connect_events()
+
+    def _call(self, method: str, *args):
+        """
+        Call a ReqClient request method by name on the shared connection.
+
+        If the websocket has dropped, reconnect once and retry, so a
+        long-running bot survives OBS restarts without reopening a
+        socket per request. Requests in _NO_RETRY reconnect but are not
+        re-sent; the original error is raised instead.
+
+        Raises:
+            OBSSDKError: if close() has been called.
+        """
+        with self._lock:
+            self._ensure_open()
+            try:
+                return getattr(self.client, method)(*args)
+            except _CONNECTION_LOST:
+                self._ensure_open()
+                self._reconnect()
+                if method in _NO_RETRY:
+                    raise
+                return getattr(self.client, method)(*args)
+
+    async def call_async(self, method: str, *args):
+        """
+        Run a controller method by name without blocking the event loop.
+
+        The blocking websocket requests run in a worker thread, so an
+        asyncio program (e.g. the Twitch bot) keeps handling its other
+        coroutines while OBS answers. The whole method runs under the
+        connection lock, so concurrent calls (e.g. two toggle_source)
+        happen one after the other rather than interleaving.
+
+        Example:
+            toggled = await obsctl.call_async("toggle_source", "Cat Jam")
+        """
+        return await asyncio.to_thread(self._call_locked, method, *args)
+
+    def _call_locked(self, method: str, *args):
+        with self._lock:
+            return getattr(self, method)(*args)
+
+    def _group_children(self, top_items: list[dict] | None = None) -> dict[str, list[dict]]:
+        """
+        Map each group in the current scene to its child scene items.
+
+        Only top-level items flagged isGroup are queried, and all of their
+        GetGroupSceneItemList requests go out in one RequestBatch, so
+        enumerating the groups costs a single round-trip.
+
+        Args:
+            top_items: the current scene's scene items, if already fetched.
+        """
+        if top_items is None:
+            scene_name = self.get_current_scene()
+            items = self._call("get_scene_item_list", scene_name)
+            top_items = items.scene_items # type: ignore
+        group_names = [item["sourceName"] for item in top_items if item.get("isGroup")] # type: ignore
+
+        results = self._send_batch([
+            {"requestType": "GetGroupSceneItemList", "requestData": {"sceneName": name}}
+            for name in group_names
+        ])
+
+        groups: dict[str, list[dict]] = {}
+        for name, result in zip(group_names, results):
+            if not result["requestStatus"]["result"]:
+                # Removed since the scene item list was read
+                continue
+            groups[name] = result["responseData"]["sceneItems"]
+        return groups
+
+    def _invalidate_sources(self) -> None:
+        """Drop the source index and mark any rebuild in flight as stale."""
+        with self._source_lock:
+            self._source_generation += 1
+            self._source_index = None
+
+    def _index_sources(self, groups: dict[str, list[dict]], generation: int) -> dict[str, tuple[str, int]]:
+        """
+        Build the source index from a _group_children() result.
+
+        The index is only stored if no invalidating event arrived since
+        `generation` was read, i.e. before the groups were fetched.
+        """
+        index: dict[str, tuple[str, int]] = {}
+        for group_name, children in groups.items():
+            for child in children:
+                index.setdefault(child["sourceName"], (group_name, child["sceneItemId"]))
+        with self._source_lock:
+            if generation == self._source_generation:
+                self._source_index = index
+        return index
+
+    def _sources_index(self) -> dict[str, tuple[str, int]]:
+        """
+        Map each source inside a group in the current scene to
+        (group_name, scene_item_id).
+
+        Built on first use and kept until a scene item event or a scene
+        change invalidates it.
+        """
+        index = self._source_index
+        if index is None:
+            generation = self._source_generation
+            index = self._index_sources(self._group_children(), generation)
+        return index
+
     def _find_source_in_groups(self, source_name: str) -> tuple[str | None, int | None]:
         """
         Find a source that lives inside a group in the current scene.
 
         Returns (group_name, scene_item_id) or (None, None) if not found.
         """
-        scene_name = self.get_current_scene()
-        items = self.client.get_scene_item_list(scene_name)
+        return self._sources_index().get(source_name, (None, None))
 
-        for item in items.scene_items: # type: ignore
-            group_name = item["sourceName"]
+    def _send_batch(self, requests: list[dict], halt_on_failure: bool = False) -> list[dict]:
+        """
+        Send several requests to OBS in a single RequestBatch message.
+
+        obsws_python's ReqClient has no batch API, so the batch (OpCode 8)
+        is written directly to its websocket.
 
+        Args:
+            requests: list of {"requestType": ..., "requestData": {...}} dicts.
+
+        Returns:
+            list[dict]: the per-request results, in the same order.
+        """
+        if not requests:
+            return []
+
+        payload = {
+            "op": 8,
+            "d": {
+                "requestId": str(uuid4()),
+                "haltOnFailure": halt_on_failure,
+                "requests": requests,
+            },
+        }
+        with self._lock:
+            self._ensure_open()
             try:
-                group_items = self.client.get_group_scene_item_list(group_name)
-            except Exception:
-                continue
+                response = self._exchange(payload)
+            except _CONNECTION_LOST:
+                self._ensure_open()
+                self._reconnect()
+                response = self._exchange(payload)
+        return response["d"]["results"]
+
+    @staticmethod
+    def _check_result(result: dict) -> None:
+        """
+        Raise if one RequestBatch result reports a failed request.
+
+        Raises:
+            OBSSDKRequestError: if that request failed.
+        """
+        status = result["requestStatus"]
+        if not status["result"]:
+            raise OBSSDKRequestError(result["requestType"], status["code"], status.get("comment"))
+
+    @classmethod
+    def _response_data(cls, result: dict) -> dict:
+        """
+        Return the responseData of one RequestBatch result.
+
+        Raises:
+            OBSSDKRequestError: if that request failed.
+        """
+        cls._check_result(result)
+        return result.get("responseData", {})
 
-            for child in group_items.scene_items: # type: ignore
-                if child["sourceName"] == source_name:
-                    return group_name, child["sceneItemId"]
+    def _exchange(self, payload: dict) -> dict:
+        """
+        Write one raw RequestBatch to the OBS websocket and read its reply.
+
+        Raises:
+            OBSSDKError: if the next frame is not the RequestBatchResponse
+                         (OpCode 9) for this batch's requestId.
+        """
+        ws = self.client.base_client.ws
+        ws.send(json.dumps(payload))
+        response = json.loads(ws.recv())
+        if response.get("op") != 9 or response["d"].get("requestId") != payload["d"]["requestId"]:
+            raise OBSSDKError(
+                f"expected RequestBatchResponse for {payload['d']['requestId']}, "
+                f"got op {response.get('op')}"
+            )
+        return response
+
+    def _load_mute_states(self, names: Iterable[str]) -> None:
+        """
+        Ask OBS for the mute state of any of `names` not tracked yet.
+
+        All missing states are fetched with one RequestBatch; after that
+        InputMuteStateChanged events keep them current.
+        """
+        missing = [name for name in names if name not in self._mute_state]
+        results = self._send_batch([
+            {"requestType": "GetInputMute", "requestData": {"inputName": name}}
+            for name in missing
+        ])
+        for name, result in zip(missing, results):
+            if result["requestStatus"]["result"]:
+                self._mute_state[name] = result["responseData"]["inputMuted"]
+
+    def _set_mute_states(self, states: dict[str, bool]) -> None:
+        """
+        Set the mute state of many inputs with one RequestBatch.
+
+        Inputs already in the desired state are left out of the batch.
 
-        return None, None
+        Args:
+            states: mapping of inputName -> desired inputMuted.
+
+        Raises:
+            OBSSDKRequestError: if any SetInputMute failed; the other
+                                inputs in the batch are still applied.
+        """
+        self._load_mute_states(states)
+        changes = {
+            name: muted
+            for name, muted in states.items()
+            if self._mute_state.get(name) != muted
+        }
+
+        results = self._send_batch([
+            {"requestType": "SetInputMute", "requestData": {"inputName": name, "inputMuted": muted}}
+            for name, muted in changes.items()
+        ])
+        failed: dict | None = None
+        for (name, muted), result in zip(changes.items(), results):
+            if result["requestStatus"]["result"]:
+                self._mute_state[name] = muted
+            elif failed is None:
+                failed = result
+
+        if failed is not None:
+            self._check_result(failed)
+
+    # Events (called from the EventClient thread)
+    def on_current_program_scene_changed(self, data) -> None:
+        self._current_scene = data.scene_name
+        self._invalidate_sources()
+
+    def on_scene_name_changed(self, data) -> None:
+        # Groups are scenes too, so this also covers renamed groups
+        if self._current_scene == data.old_scene_name:
+            self._current_scene = data.scene_name
+        self._invalidate_sources()
+
+    def on_scene_item_created(self, data) -> None:
+        self._invalidate_sources()
+
+    def on_scene_item_removed(self, data) -> None:
+        self._invalidate_sources()
+
+    def on_scene_item_list_reindexed(self, data) -> None:
+        self._invalidate_sources()
+
+    def on_input_created(self, data) -> None:
+        self._invalidate_inputs()
+
+    def on_input_removed(self, data) -> None:
+        self._invalidate_inputs()
+        self._mute_state.pop(data.input_name, None)
+
+    def on_input_name_changed(self, data) -> None:
+        self._invalidate_sources()
+        self._invalidate_inputs()
+        if data.old_input_name in self._mute_state:
+            self._mute_state[data.input_name] = self._mute_state.pop(data.old_input_name)
+
+    def on_input_mute_state_changed(self, data) -> None:
+        self._mute_state[data.input_name] = data.input_muted
 
     # Info
     def get_version(self) -> str:
         """
         Get a human-readable string describing the OBS and obs-websocket versions.
         """
-        v = self.client.get_version()
+        v = self._call("get_version")
+        return self._format_version(v.obs_version, v.obs_web_socket_version) # type: ignore
+
+    @staticmethod
+    def _format_version(obs_version: str, ws_version: str) -> str:
         return (
-            f"OBS version: {v.obs_version}\n" # type: ignore
-            f"obs-websocket version: {v.obs_web_socket_version}" # type: ignore
+            f"OBS version: {obs_version}\n"
+            f"obs-websocket version: {ws_version}"
         )
-    
+
+    def snapshot(self) -> dict:
+        """
+        Gather the startup overview of OBS in as few round-trips as possible.
+
+        The version, scene list and input list come back in one
+        RequestBatch, the current scene's items in a second request and
+        all group children in a third batch. The results also warm the
+        current scene, input and source caches, unless an OBS event
+        arrived meanwhile and made them outdated.
+
+        Returns:
+            dict with keys:
+              - 'version': same string as get_version()
+              - 'scenes': list of scene names
+              - 'current_scene': name of the current program scene
+              - 'top_items': the current scene's top-level scene items
+              - 'group_children': {group_name: [child scene items]}
+              - 'inputs': list of input info dicts, as from get_inputs()
+        """
+        # Read before any request: if a scene or input event lands while the
+        # batches are in flight, the replies are older than the event and
+        # must not be cached over it.
+        inputs_generation = self._inputs_generation
+        scene_generation = self._source_generation
+        version, scene_list, input_list = (
+            self._response_data(result)
+            for result in self._send_batch([
+                {"requestType": "GetVersion"},
+                {"requestType": "GetSceneList"},
+                {"requestType": "GetInputList"},
+            ])
+        )
+
+        current_scene = scene_list["currentProgramSceneName"]
+        with self._source_lock:
+            if scene_generation == self._source_generation:
+                self._current_scene = current_scene
+        inputs = self._store_inputs(input_list["inputs"], inputs_generation)[1]
+
+        items = self._call("get_scene_item_list", current_scene)
+        top_items = list(items.scene_items) # type: ignore
+        groups = self._group_children(top_items)
+        self._index_sources(groups, scene_generation)
+
+        return {
+            "version": self._format_version(version["obsVersion"], version["obsWebSocketVersion"]),
+            "scenes": [scene["sceneName"] for scene in scene_list["scenes"]],
+            "current_scene": current_scene,
+            "top_items": top_items,
+            "group_children": groups,
+            "inputs": list(inputs),
+        }
+
 
 
     # Scenes
@@ -67,15 +506,29 @@ class ObsController:
         """
         Return a list of all scene names in the current OBS profile.
         """
-        resp = self.client.get_scene_list()
+        resp = self._call("get_scene_list")
         return [scene["sceneName"] for scene in resp.scenes]  # type: ignore
 
     def get_current_scene(self) -> str:
         """
         Get the name of the current program (live) scene.
-        """
-        resp = self.client.get_current_program_scene()
-        return resp.current_program_scene_name  # type: ignore
+
+        The name is asked from OBS once and then kept up to date by the
+        CurrentProgramSceneChanged and SceneNameChanged events, so later
+        calls are a local read.
+        """
+        scene = self._current_scene
+        if scene is None:
+            generation = self._source_generation
+            resp = self._call("get_current_program_scene")
+            scene = resp.current_program_scene_name  # type: ignore
+            with self._source_lock:
+                if generation == self._source_generation:
+                    self._current_scene = scene
+                elif self._current_scene is not None:
+                    # A scene event landed meanwhile and is newer than the reply
+                    scene = self._current_scene
+        return scene  # type: ignore
 
     def change_scene(self, name: str) -> bool:
         """
@@ -86,7 +539,7 @@ class ObsController:
         """
         scenes = self.get_scenes()
         if name in scenes:
-            self.client.set_current_program_scene(name)
+            self._call("set_current_program_scene", name)
             return True
         else:
             return False
@@ -100,28 +553,13 @@ class ObsController:
 
         This method:
           - enumerates top-level scene items in the current program scene
-          - treats each top-level item as a potential group
-          - for items that are groups, returns the names of their children
+          - picks out the items that are groups (isGroup)
+          - returns the names of their children
 
-        Top-level items that are *not* groups are ignored.
+        Top-level items that are *not* groups are ignored. The result is
+        cached until OBS reports a scene item or scene change.
         """
-        scene_name = self.get_current_scene()
-        items = self.client.get_scene_item_list(scene_name)
-
-        names: list[str] = []
-
-        for item in items.scene_items: # type: ignore
-            group_name = item["sourceName"]
-            try:
-                group_items = self.client.get_group_scene_item_list(group_name)
-            except Exception:
-                # Not a group
-                continue
-
-            for child in group_items.scene_items: # type: ignore
-                names.append(child["sourceName"])
-
-        return names
+        return list(self._sources_index())
 
     def toggle_source(self, source_name: str) -> bool:
         """
@@ -131,31 +569,101 @@ class ObsController:
         if scene_item_id is None:
             return False
 
-        info = self.client.get_scene_item_enabled(container, scene_item_id)
+        info = self._call("get_scene_item_enabled", container, scene_item_id)
         new_state = not info.scene_item_enabled # type: ignore
 
-        self.client.set_scene_item_enabled(container, scene_item_id, new_state)
+        self._call("set_scene_item_enabled", container, scene_item_id, new_state)
         return True
     
 
 
     # Inputs / Audio (using inputKindCaps)
+    def _cached_inputs(self) -> tuple[float, list[dict], dict[str, dict], frozenset[str]]:
+        """
+        Return (fetched_at, inputs, inputs_by_name, audio_names), refetching
+        from OBS once the cached copy is older than `ttl` seconds.
+        """
+        cache = self._inputs_cache
+        if cache is None or time.monotonic() - cache[0] >= self._ttl:
+            generation = self._inputs_generation
+            resp = self._call("get_input_list")
+            cache = self._store_inputs(list(resp.inputs), generation) # type: ignore
+        return cache
+
+    def _invalidate_inputs(self) -> None:
+        """Drop the input caches and mark any fetch in flight as stale."""
+        with self._inputs_lock:
+            self._inputs_generation += 1
+            self._inputs_cache = None
+            self._audio_names = None
+
+    def _store_inputs(
+        self, inputs: list[dict], generation: int
+    ) -> tuple[float, list[dict], dict[str, dict], frozenset[str]]:
+        """
+        Index a freshly fetched input list and return the cache tuple.
+
+        The name index and the audio-capable set are built in the same
+        single pass over the list. They are only cached if no input event
+        arrived since `generation` was read, i.e. before the fetch.
+        """
+        by_name: dict[str, dict] = {}
+        audio: list[str] = []
+        for info in inputs:
+            name = info["inputName"]
+            by_name[name] = info
+            if info.get("inputKindCaps", 0) & _AUDIO_CAP:
+                audio.append(name)
+
+        cache = (time.monotonic(), inputs, by_name, frozenset(audio))
+        with self._inputs_lock:
+            if generation == self._inputs_generation:
+                self._inputs_cache = cache
+                self._audio_names = cache[3]
+        return cache
+
+    def _inputs_by_name(self) -> dict[str, dict]:
+        """
+        Map each inputName to its info dict, using the cached input list.
+        """
+        return self._cached_inputs()[2]
+
     def get_inputs(self) -> list[dict]:
         """
         Get the list of all inputs (sources) in OBS.
 
+        The list is cached for `ttl` seconds, so bursts of calls only
+        hit OBS once.
+
         Returns:
             list[dict]: Each dict typically has 'inputName', 'inputKind',
                         'inputKindCaps', etc.
         """
-        resp = self.client.get_input_list()
-        return list(resp.inputs) # type: ignore
+        return list(self._cached_inputs()[1])
+
+    def invalidate_inputs(self) -> None:
+        """
+        Drop the cached input list so the next get_inputs() asks OBS again.
+        """
+        self._invalidate_inputs()
+
+    def iter_input_names(self) -> Iterator[str]:
+        """
+        Iterate over all input names without building a list.
+        """
+        yield from self._inputs_by_name()
+
+    def iter_audio_names(self) -> Iterator[str]:
+        """
+        Iterate over the names of all audio-capable inputs.
+        """
+        yield from self._audio_inputs()
 
     def get_input_names(self) -> list[str]:
         """
         Get the list of all input names.
         """
-        return [i["inputName"] for i in self.get_inputs()]
+        return list(self.iter_input_names())
 
     def get_input_info(self, input_name: str) -> dict | None:
         """
@@ -164,27 +672,31 @@ class ObsController:
         Returns:
             dict or None if not found.
         """
-        for info in self.get_inputs():
-            if info["inputName"] == input_name:
-                return info
-        return None
+        return self._inputs_by_name().get(input_name)
 
-    def is_audio_input(self, input_name: str) -> bool:
+    def _audio_inputs(self) -> frozenset[str]:
         """
-        Check whether an input supports audio, using inputKindCaps.
+        Names of all audio-capable inputs.
 
-        According to the obs-websocket protocol, the InputKindCapability
-        flag for "supports audio" is bit 1 (value 2). So we check:
+        An input is audio-capable when its inputKindCaps has the
+        _AUDIO_CAP bit set.
 
-            bool(inputKindCaps & 2)
+        Computed at connect time and refreshed whenever the input list is
+        fetched again, e.g. after an InputCreated, InputRemoved or
+        InputNameChanged event.
         """
-        info = self.get_input_info(input_name)
-        if info is None:
-            return False
+        names = self._audio_names
+        if names is None:
+            names = self._cached_inputs()[3]
+        return names
 
-        caps = info.get("inputKindCaps", 0)
-        SUPPORTS_AUDIO = 1 << 1  # == 2
-        return bool(caps & SUPPORTS_AUDIO)
+    def is_audio_input(self, input_name: str) -> bool:
+        """
+        Check whether an input supports audio, using inputKindCaps.
+
+        Returns False if the input name doesn't exist.
+        """
+        return input_name in self._audio_inputs()
 
     def mute_input(self, input_name: str) -> bool:
         """
@@ -197,7 +709,8 @@ class ObsController:
         if not self.is_audio_input(input_name):
             return False
 
-        self.client.set_input_mute(input_name, True)
+        self._call("set_input_mute", input_name, True)
+        self._mute_state[input_name] = True
         return True
 
     def unmute_input(self, input_name: str) -> bool:
@@ -211,7 +724,8 @@ class ObsController:
         if not self.is_audio_input(input_name):
             return False
 
-        self.client.set_input_mute(input_name, False)
+        self._call("set_input_mute", input_name, False)
+        self._mute_state[input_name] = False
         return True
 
     def toggle_input_mute(self, input_name: str) -> bool:
@@ -225,7 +739,8 @@ class ObsController:
         if not self.is_audio_input(input_name):
             return False
 
-        self.client.toggle_input_mute(input_name)
+        resp = self._call("toggle_input_mute", input_name)
+        self._mute_state[input_name] = resp.input_muted  # type: ignore
         return True
 
     def mute_all_audio(self, except_inputs: list[str] | None = None) -> None:
@@ -235,13 +750,12 @@ class ObsController:
         Args:
             except_inputs: list of input names that should NOT be muted.
         """
-        skip = set(except_inputs or [])
-        for info in self.get_inputs():
-            name = info["inputName"]
-            if name in skip:
-                continue
-            if self.is_audio_input(name):
-                self.mute_input(name)
+        skip = frozenset(except_inputs or ())
+        self._set_mute_states({
+            name: True
+            for name in self.iter_audio_names()
+            if name not in skip
+        })
 
     def unmute_all_audio(self, only_inputs: list[str] | None = None) -> None:
         """
@@ -252,14 +766,11 @@ class ObsController:
                 - If None: unmute ALL audio-capable inputs.
                 - If list: unmute ONLY those audio-capable inputs whose names are in the list.
         """
-        targets: list[str]
         if only_inputs is None:
-            targets = [i["inputName"] for i in self.get_inputs() if self.is_audio_input(i["inputName"])]
+            names = self.iter_audio_names()
         else:
-            targets = [name for name in only_inputs if self.is_audio_input(name)]
-
-        for name in targets:
-            self.unmute_input(name)
+            names = (name for name in only_inputs if self.is_audio_input(name))
+        self._set_mute_states({name: False for name in names})
 
     def mute_all_but(self, keep_inputs: list[str]) -> None:
         """
@@ -267,15 +778,7 @@ class ObsController:
 
         Any kept inputs will be ensured unmuted.
         """
-        keep = set(keep_inputs)
-        for info in self.get_inputs():
-            name = info["inputName"]
-            if not self.is_audio_input(name):
-                continue
-            if name in keep:
-                self.unmute_input(name)
-            else:
-                self.mute_input(name)
+        self._apply_mute_policy(keep_inputs)
 
     def unmute_only(self, inputs: list[str]) -> None:
         """
@@ -284,31 +787,34 @@ class ObsController:
         Args:
             inputs: list of input names to keep unmuted.
         """
-        keep = set(inputs)
-        for info in self.get_inputs():
-            name = info["inputName"]
-            if not self.is_audio_input(name):
-                continue
-            if name in keep:
-                self.unmute_input(name)
-            else:
-                self.mute_input(name)
+        self._apply_mute_policy(inputs)
+
+    def _apply_mute_policy(self, keep: Iterable[str]) -> None:
+        """
+        Unmute the audio-capable inputs named in `keep` and mute every
+        other audio-capable input, sending only the changes in one batch.
+        """
+        keep_names = frozenset(keep)
+        self._set_mute_states({
+            name: name not in keep_names
+            for name in self.iter_audio_names()
+        })
 
 
 
     # Stream / Record
     def start_record(self) -> None:
         """Start OBS recording."""
-        self.client.start_record()
+        self._call("start_record")
 
     def stop_record(self) -> None:
         """Stop OBS recording."""
-        self.client.stop_record()
+        self._call("stop_record")
 
     def start_stream(self) -> None:
         """Start OBS streaming."""
-        self.client.start_stream()
+        self._call("start_stream")
 
     def stop_stream(self) -> None:
         """Stop OBS streaming."""
-        self.client.stop_stream()
\ No newline at end of file
+        self._call("stop_stream")
\ No newline at end of file
@@ -0,0 +1,119 @@
+# obsctl.py
+"""
+Thin command-line client for obsdaemon.
+
+Sends one command to the already-running daemon, which reuses its open
+OBS connection, so each call skips the websocket handshake and login.
+
+Usage:
+    python obsctl.py toggle_source "Cat Jam"
+    python obsctl.py mute_all_but '["Mic"]'
+    python obsctl.py shutdown
+
+Arguments starting with '[' or '{' are parsed as JSON (lists, dicts);
+everything else is passed as a plain string, so sources named e.g.
+"5" or "true" still work.
+"""
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+
+# Where obsdaemon listens. Windows has no asyncio unix sockets, so it
+# falls back to a loopback TCP port there, guarded by TOKEN_PATH.
+USE_UNIX_SOCKET = sys.platform != "win32"
+TCP_ADDRESS = ("127.0.0.1", 4460)
+TOKEN_PATH = Path.home() / ".obsctl_token"
+
+
+def socket_path() -> str:
+    """
+    Unix socket path: $XDG_RUNTIME_DIR/obsctl.sock when available (a
+    per-user directory), else a per-user name in the temp directory.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "obsctl.sock")
+    return os.path.join(tempfile.gettempdir(), f"obsctl-{os.getuid()}.sock")
+
+
+def parse_arg(arg: str):
+    if arg[:1] in ("[", "{"):
+        try:
+            return json.loads(arg)
+        except json.JSONDecodeError:
+            pass
+    return arg
+
+
+def connect() -> socket.socket:
+    """Open a connection to obsdaemon's control socket."""
+    address: str | tuple[str, int]
+    if USE_UNIX_SOCKET:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = socket_path()
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = TCP_ADDRESS
+
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def send_command(method: str, args: list) -> dict:
+    """
+    Send one command to obsdaemon and return its decoded reply.
+
+    Replies look like {"ok": true, "result": ...} or
+    {"ok": false, "error": "..."}.
+
+    Raises:
+        ConnectionResetError: if the daemon closed the connection without
+                              replying (e.g. it was shutting down).
+    """
+    request: dict = {"method": method, "args": args}
+    if not USE_UNIX_SOCKET:
+        request["token"] = TOKEN_PATH.read_text().strip()
+
+    with connect() as sock:
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionResetError("obsdaemon closed the connection without replying")
+    return json.loads(line)
+
+
+def main(argv: list[str]) -> int:
+    if not argv:
+        print(__doc__)
+        return 2
+
+    try:
+        reply = send_command(argv[0], [parse_arg(a) for a in argv[1:]])
+    except ConnectionResetError as e:
+        print("ERROR: obsdaemon closed the connection, the command may not have run.")
+        print("Reason:", e)
+        return 1
+    except OSError as e:
+        print("ERROR: Unable to reach obsdaemon, is it running?")
+        print("Reason:", e)
+        return 1
+
+    if not reply["ok"]:
+        print("ERROR:", reply["error"])
+        return 1
+
+    if reply["result"] is not None:
+        print(reply["result"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
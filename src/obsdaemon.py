@@ -0,0 +1,153 @@
+# obsdaemon.py
+import asyncio
+import hmac
+import json
+import os
+import secrets
+import signal
+from twitchController import TwitchChatBot
+from obsController import ObsController
+import obsctl as ctl_client
+
+# ObsController methods that obsctl is allowed to call
+COMMANDS = {
+    "get_version", "snapshot",
+    "get_scenes", "get_current_scene", "change_scene",
+    "get_sources", "toggle_source",
+    "get_inputs", "get_input_names", "get_input_info", "is_audio_input",
+    "mute_input", "unmute_input", "toggle_input_mute",
+    "mute_all_audio", "unmute_all_audio", "mute_all_but", "unmute_only",
+    "start_record", "stop_record", "start_stream", "stop_stream",
+}
+
+
+async def handle_client(
+    obsctl: ObsController,
+    stop: asyncio.Event,
+    token: str | None,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+):
+    """Answer each JSON command line from an obsctl client."""
+    try:
+        while line := await reader.readline():
+            try:
+                request = json.loads(line)
+                if token is not None and not hmac.compare_digest(str(request.get("token", "")), token):
+                    raise PermissionError("invalid token")
+
+                method = request["method"]
+                if method == "shutdown":
+                    stop.set()
+                    result = None
+                elif method in COMMANDS:
+                    result = await obsctl.call_async(method, *request.get("args", []))
+                else:
+                    raise ValueError(f"unknown command: {method}")
+                reply = {"ok": True, "result": result}
+            except Exception as e:
+                reply = {"ok": False, "error": str(e)}
+
+            writer.write(json.dumps(reply).encode() + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def run_bot(bot: TwitchChatBot, stop: asyncio.Event):
+    """
+    Run the Twitch bot until `stop` is set.
+
+    If the bot fails (e.g. missing TWITCH_BOT_TOKEN/SECRET, or OAuth that
+    needs a browser under systemd), log why and return, so the daemon
+    keeps serving obsctl commands.
+    """
+    try:
+        await bot.run(stop)
+    except Exception as e:
+        print("ERROR: Twitch bot stopped, obsctl commands are still served.")
+        print("Reason:", e)
+
+
+def already_running() -> bool:
+    """True if another daemon answers on the control socket."""
+    try:
+        ctl_client.connect().close()
+    except OSError:
+        return False
+    return True
+
+
+async def start_control_server(obsctl: ObsController, stop: asyncio.Event) -> asyncio.AbstractServer:
+    """
+    Listen for obsctl commands on the unix socket (or loopback TCP).
+
+    The unix socket is only readable by the current user. The TCP
+    fallback is open to every local process, so each request there must
+    carry the token written to obsctl.TOKEN_PATH at startup.
+    """
+    token: str | None = None
+
+    def handler(reader, writer):
+        return handle_client(obsctl, stop, token, reader, writer)
+
+    if ctl_client.USE_UNIX_SOCKET:
+        path = ctl_client.socket_path()
+        # Only a stale file from a crashed daemon is left at this point;
+        # main() refuses to start if a live daemon answers on it.
+        if os.path.exists(path):
+            os.remove(path)
+        old_umask = os.umask(0o177)
+        try:
+            return await asyncio.start_unix_server(handler, path=path)
+        finally:
+            os.umask(old_umask)
+
+    token = secrets.token_hex(16)
+    ctl_client.TOKEN_PATH.write_text(token)
+    return await asyncio.start_server(handler, *ctl_client.TCP_ADDRESS)
+
+
+async def main():
+    if already_running():
+        print("ERROR: obsdaemon is already running.")
+        raise SystemExit(1)
+
+    # Run until SIGTERM/SIGINT or `obsctl shutdown`; stdin is never read,
+    # so the daemon works under nohup, systemd or with </dev/null.
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            # Windows: Ctrl+C still raises KeyboardInterrupt
+            pass
+
+    # ONE ObsController, created once at startup and closed on exit
+    with ObsController() as obsctl:
+        snap = obsctl.snapshot()
+        print(snap["version"])
+        print(f"Scenes found: {snap['scenes']}")
+        print(f"Video Sources found: {obsctl.get_sources()}")
+        print(f"Audio Sources found: {[i['inputName'] for i in snap['inputs']]}")
+
+        # obsctl commands share the same connection as the bot
+        server = await start_control_server(obsctl, stop)
+
+        # Pass it into the bot so the bot can use it
+        bot = TwitchChatBot(obs_controller=obsctl)
+
+        # The bot runs as its own task; the daemon's lifetime is `stop`
+        bot_task = asyncio.create_task(run_bot(bot, stop))
+        async with server:
+            try:
+                await stop.wait()
+            finally:
+                stop.set()
+                await bot_task
+                if ctl_client.USE_UNIX_SOCKET and os.path.exists(ctl_client.socket_path()):
+                    os.remove(ctl_client.socket_path())
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,6 +4,7 @@ from twitchAPI.type import AuthScope, ChatEvent
 from twitchAPI.chat import Chat, EventData, ChatMessage, ChatSub, ChatCommand
 import asyncio
 import os
+import threading
 
 
 class TwitchChatBot:
@@ -77,7 +78,35 @@ class TwitchChatBot:
         # Commands
         self.chat.register_command("reply", self.test_command)
 
-    async def run(self):
+    async def wait_for_enter(self):
+        """
+        Wait until ENTER is pressed (or stdin closes) without blocking the loop.
+
+        input() runs in a daemon thread rather than the default executor,
+        so Ctrl+C can still shut the program down while it is waiting.
+        """
+        loop = asyncio.get_running_loop()
+        pressed = asyncio.Event()
+
+        def read_line():
+            try:
+                input("press ENTER to stop\n")
+            except EOFError:
+                pass
+            try:
+                loop.call_soon_threadsafe(pressed.set)
+            except RuntimeError:
+                # loop already closed
+                pass
+
+        threading.Thread(target=read_line, daemon=True).start()
+        await pressed.wait()
+
+    async def run(self, stop: asyncio.Event | None = None):
+        """
+        Run the bot until `stop` is set, or until ENTER is pressed if no
+        stop event is given.
+        """
         await self.setup()
         assert self.chat is not None
         assert self.twitch is not None
@@ -85,7 +114,10 @@ class TwitchChatBot:
         self.chat.start()
 
         try:
-            input("press ENTER to stop\n")
+            if stop is None:
+                await self.wait_for_enter()
+            else:
+                await stop.wait()
         finally:
             self.chat.stop()
             await self.twitch.close()